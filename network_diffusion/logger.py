@@ -67,27 +67,25 @@ class Logger:
 
         :param model_parameters: parameters of the propagation model to store
         """
-        # initialise container for splatted data
-        self._global_stats_converted = {
-            k: pd.DataFrame(columns=model_parameters[k])
-            for k in model_parameters.keys()
+        # gather counts of states in each layer epoch by epoch
+        rows: dict[str, list[dict[str, int]]] = {
+            k: [] for k in model_parameters.keys()
         }
-
-        # fill containers
         for epoch in self._global_stats:
             for layer, vals in epoch.items():
-                self._global_stats_converted[layer] = pd.concat(
-                    [
-                        self._global_stats_converted[layer],
-                        pd.DataFrame(dict(vals), index=[0]),
-                    ],
-                    ignore_index=True,
-                )
-
-        # change NaN values to 0 and all values to integers
-        for layer, vals in self._global_stats_converted.items():
+                rows[layer].append(dict(vals))
+
+        # create a dataframe for each layer at once, keep states of the model
+        # first and change NaN values to 0 and all values to 32-bit integers
+        self._global_stats_converted = {}
+        for layer, l_rows in rows.items():
+            l_stats = pd.DataFrame(l_rows)
+            columns = dict.fromkeys([*model_parameters[layer], *l_stats])
             self._global_stats_converted[layer] = (
-                vals.infer_objects().fillna(0).astype(int)
+                l_stats.reindex(columns=[*columns])
+                .infer_objects()
+                .fillna(0)
+                .astype(np.int32)
             )
 
     def __str__(self) -> str:
@@ -101,20 +99,21 @@ class Logger:
             is plotted on screen
         :param path: path to save figure
         """
-        fig = plt.figure()
+        stats = self._global_stats_converted
+        _, axes = plt.subplots(len(stats), 1, sharex=True, squeeze=False)
+
+        # ticks are scaled by the number of nodes of the first layer
+        y_tics_num = next(iter(stats.values())).iloc[0].sum()
+        y_tics = np.arange(0, y_tics_num + 1, 20)
 
-        for i, layer in enumerate(self._global_stats_converted, 1):
-            ith_axis = fig.add_subplot(len(self._global_stats_converted), 1, i)
-            self._global_stats_converted[layer].plot(ax=ith_axis, legend=True)
+        for ith_axis, (layer, l_stats) in zip(axes[:, 0], stats.items()):
+            l_stats.plot(ax=ith_axis, legend=True)
             ith_axis.set_title(layer)
             ith_axis.legend(loc="upper right")
             ith_axis.set_ylabel("Nodes")
-            if i == 1:
-                y_tics_num = self._global_stats_converted[layer].iloc[0].sum()
-            ith_axis.set_yticks(np.arange(0, y_tics_num + 1, 20))
-            if i == len(self._global_stats_converted):
-                ith_axis.set_xlabel("Epoch")
+            ith_axis.set_yticks(y_tics)
             ith_axis.grid()
+        axes[-1, 0].set_xlabel("Epoch")
 
         plt.tight_layout()
         if to_file:
@@ -142,8 +141,8 @@ class Logger:
             Path(path).mkdir(exist_ok=True, parents=True)
 
             # save progress in propagation of each layer to csv file
-            for stat in self._global_stats_converted:
-                self._global_stats_converted[stat].to_csv(
+            for stat, stat_df in self._global_stats_converted.items():
+                stat_df.to_csv(
                     path + "/" + stat + "_propagation_report.csv",
                     index_label="epoch",
                 )
@@ -172,8 +171,8 @@ class Logger:
             print(self._network_description)
             print(self._model_description)
             print(f"{BOLD_UNDERLINE}\npropagation report\n{THIN_UNDERLINE}")
-            for stat in self._global_stats_converted:
-                print(stat, "\n", self._global_stats_converted[stat], "\n")
+            for stat, stat_df in self._global_stats_converted.items():
+                print(stat, "\n", stat_df, "\n")
             print(BOLD_UNDERLINE)
             if visualisation:
                 self.plot()
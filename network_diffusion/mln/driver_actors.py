@@ -9,7 +9,6 @@
 
 """Script with functions for driver actor selections."""
 
-from copy import deepcopy
 from typing import Any
 
 from network_diffusion.mln.actor import MLNetworkActor
@@ -46,7 +45,7 @@ def minimum_dominating_set_with_initial(
     net_layer = net.layers[layer]
     isolated = set(actor_ids) - set(net_layer.nodes())
     dominating_set = dominating_set | isolated
-    dominated = deepcopy(dominating_set)
+    dominated = set(dominating_set)
 
     for node_u in dominating_set:
         if node_u in net_layer.nodes:
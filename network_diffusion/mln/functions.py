@@ -133,21 +133,10 @@ def multiplexing_coefficient(net: MultilayerNetwork) -> float:
     """
     assert len(net.layers) > 0, "Import network to the object first!"
 
-    # create set of all nodes in the network
-    all_nodes = set()
-    for graph in net.layers.values():
-        all_nodes.update([*graph.nodes()])
-
-    # create set of all common nodes in the network over the layers
-    common_nodes = set()
-    for node in all_nodes:
-        _ = True
-        for layer in net.layers.values():
-            if node not in layer:
-                _ = False
-                break
-        if _ is True:
-            common_nodes.add(node)
+    # create sets of all nodes and common nodes in the network over layers
+    layers_nodes = [set(graph.nodes) for graph in net.layers.values()]
+    all_nodes = set.union(*layers_nodes)
+    common_nodes = set.intersection(*layers_nodes)
 
     if len(all_nodes) > 0:
         return len(common_nodes) / len(all_nodes)
@@ -177,11 +166,10 @@ def all_neighbors(
     If the graph is directed returns predecessors as well as successors.
     Overloads networkx.classes.functions.all_neighbours.
     """
-    neighbours = []
+    neighbours: set[Any] = set()
     for l_name in actor.layers:
-        l_graph = net.layers[l_name]
-        neighbours.extend([*nx.all_neighbors(l_graph, actor.actor_id)])
-    return iter([net.get_actor(i) for i in set(neighbours)])
+        neighbours.update(nx.all_neighbors(net.layers[l_name], actor.actor_id))
+    return iter([net.get_actor(i) for i in neighbours])
 
 
 def core_number(net: MultilayerNetwork) -> dict[MLNetworkActor, int]:
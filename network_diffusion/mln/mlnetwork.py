@@ -15,12 +15,70 @@ from typing import Any
 
 import networkx as nx
 import numpy as np
+from scipy import sparse
 from uunet import multinet
 
 from network_diffusion.mln.actor import MLNetworkActor
 from network_diffusion.utils import BOLD_UNDERLINE, THIN_UNDERLINE
 
 
+_CLUSTERING_BLOCK_ENTRIES = 2**21
+
+
+def _average_clustering(graph: nx.Graph) -> float:
+    """
+    Compute average clustering coefficient of the graph.
+
+    For simple undirected graphs triangles are counted with sparse matrices,
+    i.e. the number of closed walks of length 3 through the node is a row sum
+    of (A @ A) * A. To keep memory bounded on graphs with hubs, the product is
+    computed for blocks of rows, each of which can produce at most
+    `_CLUSTERING_BLOCK_ENTRIES` nonzero entries (a single row excepted).
+    Otherwise `nx.average_clustering` is used.
+
+    :param graph: a non-empty graph to compute the coefficient for
+    :return: average clustering coefficient, equal to `nx.average_clustering`
+    """
+    if graph.is_directed() or graph.is_multigraph():
+        return nx.average_clustering(graph)
+
+    # self-loops are not taken into account in clustering
+    adj = nx.to_scipy_sparse_array(
+        graph, weight=None, dtype=np.int64, format="csr"
+    )
+    adj = (adj - sparse.diags_array(adj.diagonal(), dtype=adj.dtype)).tocsr()
+    adj.eliminate_zeros()
+    degrees = np.asarray(adj.sum(axis=1)).ravel()
+
+    # row i of A @ A has at most as many nonzeros as sum of its neighbours'
+    # degrees, use that bound to split rows into blocks
+    cum_entries = np.cumsum(adj @ degrees)
+    closed_walks = np.zeros(len(degrees), dtype=np.int64)
+    start = 0
+    while start < len(degrees):
+        done = cum_entries[start - 1] if start > 0 else 0
+        stop = int(
+            np.searchsorted(
+                cum_entries, done + _CLUSTERING_BLOCK_ENTRIES, side="right"
+            )
+        )
+        stop = max(stop, start + 1)
+        rows = adj[start:stop]
+        closed_walks[start:stop] = np.asarray(
+            (rows @ adj).multiply(rows).sum(axis=1)
+        ).ravel()
+        start = stop
+
+    denominators = degrees * (degrees - 1)
+    coefficients = np.divide(
+        closed_walks,
+        denominators,
+        out=np.zeros(len(degrees)),
+        where=denominators > 0,
+    )
+    return float(coefficients.mean())
+
+
 class MultilayerNetwork:
     """
     A basic container for the multilayer network.
@@ -151,26 +209,28 @@ class MultilayerNetwork:
         final_str += f"\tnumber of layers - {len(self.layers)}\n"
         final_str += f"\tnumber of actors - {self.get_actors_num()}\n"
 
-        edges_nb, nodes_nb = [], []
-        for layer_graph in self.layers.values():
-            edges_nb.append(len(layer_graph.edges()))
-            nodes_nb.append(len(layer_graph.nodes()))
-        final_str += f"\tnumber of nodes - {sum(nodes_nb)}\n"
-        final_str += f"\tnumber of edges - {sum(edges_nb)}\n"
+        # count nodes and edges of each layer once, both are used twice
+        sizes = {
+            name: (graph.number_of_nodes(), graph.number_of_edges())
+            for name, graph in self.layers.items()
+        }
+        nodes_nb, edges_nb = map(sum, zip(*sizes.values()))
+        final_str += f"\tnumber of nodes - {nodes_nb}\n"
+        final_str += f"\tnumber of edges - {edges_nb}\n"
 
         for name, graph in self.layers.items():
+            nodes_l, edges_l = sizes[name]
             final_str += f"\nlayer '{name}' parameters:\n"
             final_str += (
                 f"\tgraph type - {type(graph)}\n\tnumber of nodes - "
-                f"{len(graph.nodes())}\n\tnumber of edges - "
-                f"{len(graph.edges())}\n"
+                f"{nodes_l}\n\tnumber of edges - {edges_l}\n"
             )
-            avg_deg = np.average([_[1] for _ in graph.degree])
+            avg_deg = 2 * edges_l / nodes_l if nodes_l > 0 else np.nan
             final_str += f"\taverage degree - {round(avg_deg, 4)}\n"
             if len(graph) > 0:
                 final_str += (
                     f"\tclustering coefficient - "
-                    f"{round(nx.average_clustering(graph), 4)}\n"
+                    f"{round(_average_clustering(graph), 4)}\n"
                 )
             else:
                 final_str += "\tclustering coefficient - nan\n"
@@ -248,12 +308,8 @@ class MultilayerNetwork:
         """
         actor_dict: dict[str, dict] = {}
         for layer_name, layer_graph in self.layers.items():
-            for node in layer_graph.nodes:
-                if node not in actor_dict:
-                    actor_dict[node] = {}
-                actor_dict[node][layer_name] = layer_graph.nodes[node][
-                    "status"
-                ]
+            for node, status in layer_graph.nodes(data="status"):
+                actor_dict.setdefault(node, {})[layer_name] = status
 
         actor_list = [
             MLNetworkActor(actor_id=a_name, layers_states=a_layers_states)
@@ -268,9 +324,10 @@ class MultilayerNetwork:
         """Get actor data basing on its name."""
         layers_states = {}
         for layer_name, layer_graph in self.layers.items():
-            if not layer_graph.nodes.get(actor_id):
+            node_data = layer_graph.nodes.get(actor_id)
+            if not node_data:
                 continue
-            layers_states[layer_name] = layer_graph.nodes[actor_id]["status"]
+            layers_states[layer_name] = node_data["status"]
         if len(layers_states) == 0:
             raise ValueError(
                 f"Actor with id: {actor_id} doesn't exist in the network!"
@@ -85,13 +85,11 @@ class BaseModel(ABC):
         :param net: network to update
         :param activated_nodes: already activated nodes
         """
-        out_json = []
+        l_nodes = {name: graph.nodes for name, graph in net.layers.items()}
         for active_node in activated_nodes:
-            net.layers[active_node.layer_name].nodes[active_node.node_name][
-                "status"
-            ] = active_node.new_state
-            out_json.append(active_node.to_json())
-        return out_json
+            node = l_nodes[active_node.layer_name][active_node.node_name]
+            node["status"] = active_node.new_state
+        return [active_node.to_json() for active_node in activated_nodes]
 
     @abstractmethod
     def get_allowed_states(
@@ -119,8 +117,6 @@ class BaseModel(ABC):
         """
         statistics = {}
         for name, layer in net.layers.items():
-            tab = []
-            for node in layer.nodes():
-                tab.append(layer.nodes[node]["status"])
-            statistics[name] = tuple(Counter(tab).items())
+            statuses = (status for _, status in layer.nodes(data="status"))
+            statistics[name] = tuple(Counter(statuses).items())
         return statistics
@@ -78,24 +78,19 @@ class DSAAModel(BaseModel):
             l_nodes_num = len(l_graph.nodes())
 
             # set ranges
-            _rngs = [
-                sum(list(l_budget.values())[:x]) for x in range(len(l_budget))
-            ] + [l_nodes_num]
-            ranges: list[tuple[int, int]] = list(zip(_rngs[:-1], _rngs[1:]))
+            bounds = np.cumsum([0, *l_budget.values()])
+            bounds[-1] = l_nodes_num
 
             # generate update buffer
-            for i, _ in enumerate(ranges):
-                state = list(l_budget.keys())[i]
-                low_range = ranges[i][0]  # pylint: disable=R1736
-                high_range = ranges[i][1]  # pylint: disable=R1736
-                for index in range(low_range, high_range):
-                    seed_nodes.append(
-                        NetworkUpdateBuffer(
-                            node_name=ranking[index],
-                            layer_name=l_name,
-                            new_state=state,
-                        )
+            for state, low_range, high_range in zip(
+                l_budget, bounds[:-1], bounds[1:]
+            ):
+                seed_nodes.extend(
+                    NetworkUpdateBuffer(
+                        node_name=node, layer_name=l_name, new_state=state
                     )
+                    for node in ranking[low_range:high_range]
+                )
 
         # set initial states and return json to save in logs
         return seed_nodes
@@ -116,30 +111,30 @@ class DSAAModel(BaseModel):
         current_state = layer_graph.nodes[agent]["status"]
 
         # import possible transitions for state of the node
-        av_trans = self._compartmental_graph.get_possible_transitions(
-            net.get_actor(agent).states_as_compartmental_graph(), layer_name
+        av_trans = self._compartmental_graph.get_possible_transitions_actor(
+            net.get_actor(agent), layer_name
         )
 
         # if there is no possible transition don't do anything
         if len(av_trans) <= 0:
             return current_state
 
-        # iterate through neighbours of current node
-        for neighbour in nx.neighbors(layer_graph, agent):
-            av_new_state = layer_graph.nodes[neighbour]["status"]
-
-            # if state of neighbour node is in possible transitions and
-            # tossed 1 due to it's weight
-            if (
-                av_new_state in av_trans
-                and np.random.choice(
-                    [0, 1],
-                    p=[1 - av_trans[av_new_state], av_trans[av_new_state]],
-                )
-                == 1
-            ):
-                # return new state of current node and break iteration
-                return av_new_state
+        # toss for all neighbours at once; the first one whose state is
+        # reachable from the current one and whose toss is lower than weight
+        # of the transition determines a new state of the current node
+        nodes = layer_graph.nodes
+        neighbours = list(layer_graph.adj[agent])
+        weights = np.fromiter(
+            (
+                av_trans.get(nodes[neighbour]["status"], 0.0)
+                for neighbour in neighbours
+            ),
+            dtype=np.float64,
+            count=len(neighbours),
+        )
+        hits = np.flatnonzero(np.random.random(len(neighbours)) < weights)
+        if len(hits) > 0:
+            return nodes[neighbours[hits[0]]]["status"]
 
         return current_state
 
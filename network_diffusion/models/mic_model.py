@@ -194,10 +194,11 @@ class MICModel(BaseModel):
             return self.ACTIVATED_NODE
 
         # iterate through neighbours of node and compute impuls
-        for neighbour in l_graph.neighbors(agent.actor_id):
+        nodes = l_graph.nodes
+        for neighbour in l_graph.adj[agent.actor_id]:
 
             # if neighbour is active, it can send signal to activation of actor
-            if l_graph.nodes[neighbour]["status"] == self.ACTIVE_NODE:
+            if nodes[neighbour]["status"] == self.ACTIVE_NODE:
 
                 # if a tossed number from unif. distr. < threshold, activ. node
                 if random.random() < self.probability:
@@ -195,11 +195,19 @@ class MLTModel(BaseModel):
             (f"{self.PROCESS_NAME}.{self.INACTIVE_STATE}",), self.PROCESS_NAME
         )
 
+        # isolated actor cannot receive any impuls
+        degree = nx.degree(l_graph, agent.actor_id)
+        if degree == 0:
+            return current_state
+
         # iterate through neighbours of node and compute impuls
         impuls = 0
-        for neighbour in nx.neighbors(l_graph, agent.actor_id):
-            if l_graph.nodes[neighbour]["status"] == self.ACTIVE_STATE:
-                impuls += 1 / nx.degree(l_graph, agent.actor_id)  # type:ignore
+        nodes = l_graph.nodes
+        neighbours = l_graph.adj[agent.actor_id]
+        impuls_unit = 1 / degree
+        for neighbour in neighbours:
+            if nodes[neighbour]["status"] == self.ACTIVE_STATE:
+                impuls += impuls_unit
 
         # if thresh. has been reached return positive input, otherwise negative
         if impuls > av_trans[self.ACTIVE_STATE]:
@@ -159,10 +159,8 @@ class TemporalNetworkEpistemologyModel(BaseModel):
         :return: a tuple with agent state, belief level and evidence
         """
         # TODO: consider operating on dictionary instead of tuple
-        state: str = encoded_status.split("_")[0]
-        belief: float = float(encoded_status.split("_")[1])
-        evidence: int = int(encoded_status.split("_")[2])
-        return state, belief, evidence
+        state, belief, evidence = encoded_status.split("_")
+        return state, float(belief), int(evidence)
 
     def agent_evaluation_step(  # pylint: disable=R0914
         self, agent: MLNetworkActor, layer_name: str, net: MultilayerNetwork
@@ -182,9 +180,10 @@ class TemporalNetworkEpistemologyModel(BaseModel):
         state, belief, evidence = self.decode_actor_status(
             agent.states[layer_name]
         )
+        nodes = l_graph.nodes
         neighbours_states = [
-            self.decode_actor_status(l_graph.nodes[n]["status"])
-            for n in l_graph.neighbors(agent.actor_id)
+            self.decode_actor_status(nodes[n]["status"])
+            for n in l_graph.adj[agent.actor_id]
         ]
         b_neighbours_states = [
             state for state in neighbours_states if state[0] == self.B_STATE
@@ -269,8 +268,9 @@ class TemporalNetworkEpistemologyModel(BaseModel):
         """
         statistics = {}
         for name, layer in net.layers.items():
-            tab = []
-            for node in layer.nodes():
-                tab.append(layer.nodes[node]["status"].split("_")[0])
-            statistics[name] = tuple(Counter(tab).items())
+            states = (
+                status.split("_", 1)[0]
+                for _, status in layer.nodes(data="status")
+            )
+            statistics[name] = tuple(Counter(states).items())
         return statistics
@@ -11,27 +11,56 @@
 
 # pylint: disable=W0141
 
+import bisect
+import functools
 import itertools
-from random import choice
-from typing import Any
+import math
+import sys
+from dataclasses import dataclass, field
+from random import sample
+from typing import Any, Iterable
 
 import networkx as nx
 import numpy as np
 
+from network_diffusion.mln.actor import MLNetworkActor
 from network_diffusion.mln.mlnetwork import MultilayerNetwork
 from network_diffusion.utils import BOLD_UNDERLINE, THIN_UNDERLINE, NumericType
 
 
+@dataclass
+class _DerivedData:
+    """Auxiliary class to keep data derived from the compartmental graph."""
+
+    compartments: dict[str, tuple[str, ...]] | None = None
+    transition_index: dict[tuple[str, tuple[str, ...]], dict[str, float]] = (
+        field(default_factory=dict)
+    )
+    actor_states: dict[tuple[tuple[str, str], ...], tuple[str, ...]] = field(
+        default_factory=dict
+    )
+    transition_tensors: dict[str, np.ndarray] = field(default_factory=dict)
+    edge_tuples: dict[
+        str, tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]
+    ] = field(default_factory=dict)
+
+
 class CompartmentalGraph:
     """Class which encapsulates model of processes spread in the network."""
 
-    reserved_names = {"graph", "background_weight", "_seeding_budget"}
+    reserved_names = {
+        "graph",
+        "background_weight",
+        "_seeding_budget",
+        "_derived",
+    }
 
     def __init__(self) -> None:
         """Create empty object."""
         self.graph: dict[str, nx.Graph] = {}
         self.background_weight: float = float("inf")
         self._seeding_budget: dict[str, tuple[NumericType, ...]] = {}
+        self._derived = _DerivedData()
 
     def __str__(self) -> str:
         """Print out quickly properties of the graph."""
@@ -53,13 +82,14 @@ class CompartmentalGraph:
         self, proposed_is: dict[str, tuple[NumericType, ...]]
     ) -> None:
         """Set seeding budget in each of compartments."""
-        assert proposed_is.keys() == self.get_compartments().keys(), (
+        comps = self.get_compartments()
+        assert proposed_is.keys() == comps.keys(), (
             "Layer names in argument should be the same as layer names in "
             "propagation model!"
         )
 
         ass_states_arg = [len(s) for s in proposed_is.values()]
-        ass_states_net = [len(s) for s in self.get_compartments().values()]
+        ass_states_net = [len(s) for s in comps.values()]
         assert ass_states_net == ass_states_arg, (
             f"Shape of argument {ass_states_arg} should be the same as shape "
             f"of states in propagation model {ass_states_net}!"
@@ -98,10 +128,11 @@ class CompartmentalGraph:
             def get_size(process: str) -> int:
                 return nodes_num[process]
 
+        comps = self.get_compartments()
         seeding_budget = {}
         for process, pcts in self.seeding_budget.items():
             bins = self._int_to_bins(pcts, get_size(process))
-            states = self.get_compartments()[process]
+            states = comps[process]
             seeding_budget[process] = dict(zip(states, bins))
         return seeding_budget
 
@@ -109,17 +140,16 @@ class CompartmentalGraph:
     def _int_to_bins(
         bins: tuple[NumericType, ...], base_num: int
     ) -> list[int]:
-        binned_number: list[int] = []
-        for idx, percentage in enumerate(bins, 1):
-            size_of_bin = int(percentage * base_num / 100)
-            while sum(binned_number) + size_of_bin > base_num:
-                size_of_bin -= 1
-            if idx == len(bins):
-                while sum(binned_number) + size_of_bin < base_num:
-                    size_of_bin += 1
-            binned_number.append(size_of_bin)
-
-        return binned_number
+        """
+        Split `base_num` into integer bins proportional to given percentages.
+
+        Bins are floored and clipped so that their cumulative sum does not
+        exceed `base_num`, the last bin takes up the residue.
+        """
+        sizes = np.trunc(np.asarray(bins, dtype=np.float64) * base_num / 100)
+        bounds = np.minimum(np.cumsum(sizes, dtype=np.int64), base_num)
+        bounds[-1] = base_num
+        return np.diff(bounds, prepend=0).tolist()
 
     def add(self, process_name: str, states: list[str]) -> None:
         """
@@ -131,6 +161,8 @@ class CompartmentalGraph:
         assert len(states) == len(set(states)), "Names must be unique!"
         assert process_name not in self.reserved_names, "Invalid name"
         self.__setattr__(process_name, states)  # pylint: disable=C2801
+        self._derived.compartments = None
+        self._derived.actor_states = {}
 
     def _get_desctiprion_str(self) -> str:
         """
@@ -145,8 +177,9 @@ class CompartmentalGraph:
             f"{BOLD_UNDERLINE}\ncompartmental model\n{THIN_UNDERLINE}\n"
             "processes, their states and initial sizes:"
         )
+        comps = self.get_compartments()
         for process, pcts in self.seeding_budget.items():
-            states = self.get_compartments()[process]
+            states = comps[process]
             global_info += f"\n\t'{process}': ["
             for state, percentage in zip(states, pcts):
                 global_info += f"{state}:{percentage}%, "
@@ -159,33 +192,58 @@ class CompartmentalGraph:
                 f"{THIN_UNDERLINE}\n"
                 f"process '{g_name}' transitions with nonzero weight:\n"
             )
-            for edge in g_net.edges():
-                if g_net.edges[edge]["weight"] == 0.0:
+            for start, finish, weight in g_net.edges(data="weight"):
+                if weight == 0:
                     continue
-                mask = [g_name in _ for _ in edge[0]]
-                start = np.array(edge[0])[mask][0].split(".")[1]
-                finish = np.array(edge[1])[mask][0].split(".")[1]
-                constraints = np.array(edge[0])[[not _ for _ in mask]]
-                transitions_info += (
-                    f"\tfrom {start} to {finish} with probability "
-                    f"{g_net.edges[edge]['weight']} and constrains "
-                    f"{constraints}\n"
+                transitions_info += self._get_transition_str(
+                    g_name, start, finish, weight
                 )
 
         return global_info + transitions_info + BOLD_UNDERLINE + "\n"
 
+    @staticmethod
+    def _get_transition_str(
+        layer: str,
+        start: tuple[str, ...],
+        finish: tuple[str, ...],
+        weight: float,
+    ) -> str:
+        """
+        Describe a single transition of the process graph.
+
+        :param layer: name of the process the transition belongs to
+        :param start: a source state of the edge
+        :param finish: a target state of the edge
+        :param weight: a weight of the edge
+
+        :return: a line describing the transition
+        """
+        layer_tag = layer + "."
+        start_state = next(n for n in start if n.startswith(layer_tag))
+        finish_state = next(n for n in finish if n.startswith(layer_tag))
+        constraints = " ".join(
+            f"'{n}'" for n in start if not n.startswith(layer_tag)
+        )
+        return (
+            f"\tfrom {start_state[len(layer_tag) :]} to "
+            f"{finish_state[len(layer_tag) :]} with probability {weight} "
+            f"and constrains [{constraints}]\n"
+        )
+
     def get_compartments(self) -> dict[str, tuple[str, ...]]:
         """
         Get model parameters, i.e. names of layers and states in each layer.
 
-        :return: dictionary keyed by names of layer, valued by tuples of
-            states labels
+        :return: a copy of dictionary keyed by names of layer, valued by
+            tuples of states labels
         """
-        hyperparams = {}
-        for name, val in self.__dict__.items():
-            if name not in self.reserved_names:
-                hyperparams[name] = val
-        return hyperparams
+        if self._derived.compartments is None:
+            self._derived.compartments = {
+                name: val
+                for name, val in self.__dict__.items()
+                if name not in self.reserved_names
+            }
+        return dict(self._derived.compartments)
 
     def compile(
         self, background_weight: float = 0.0, track_changes: bool = False
@@ -197,63 +255,79 @@ class CompartmentalGraph:
         transitions matrices are stored as a networkx one-directional graph.
         After compilation user is able to set certain transitions in model.
 
+        Transitions of up to `_CACHED_TRANSITIONS_LIMIT` edges are reused by
+        models compiled from the same compartments. Only a few such sets are
+        kept in memory; larger ones are always created from scratch, so that
+        they do not outlive their models.
+
         :param background_weight: [0,1] describes default weight of transition
             to make propagation more realistic by default it is set to 0
         :param track_changes: a flag to track progress of matrices creation
         """
-        # pylint: disable=R0914
         assert 1 >= background_weight >= 0, "Weight value not in [0, 1] range"
 
-        # initialise dictionary to store transition graphs for each later
-        transitions_graphs = {}
+        # obtain transitions for each layer, reuse them if small model with
+        # the same compartments has been already compiled
+        compartments = tuple(
+            (layer_name, tuple(layer_type))
+            for layer_name, layer_type in self.get_compartments().items()
+        )
+        states_nums = [len(layer_type) for _, layer_type in compartments]
+        transitions_num = math.prod(states_nums) * sum(
+            states_num - 1 for states_num in states_nums
+        )
+        if track_changes or transitions_num > _CACHED_TRANSITIONS_LIMIT:
+            transitions = dict(
+                _create_transitions(compartments, track_changes)
+            )
+        else:
+            transitions = dict(_create_transitions_cached(compartments))
 
         # create transition graph for each layer
-        for layer_name, layer_type in self.__dict__.items():
-            if layer_name in self.reserved_names:
-                continue
-            if track_changes:
-                print(layer_name)
-
-            # prepare names in current layer
-            cl_names = [str(layer_name) + "." + str(v) for v in layer_type]
-            if track_changes:
-                print(f"Variables in current layer: {cl_names}")
-
-            # copy layers description and delete current layer to prepare
-            # constants for current layer
-            self_dict_copy = self.__dict__.copy()
-            del self_dict_copy[layer_name]
-            for attr in self.reserved_names:
-                del self_dict_copy[attr]
-
-            # prepare names in other layers which are constant to current layer
-            ol_names = []
-            for i in self_dict_copy.keys():  # pylint: disable=C0201, C0206
-                i_names = [str(i) + "." + str(v) for v in self_dict_copy[i]]
-                ol_names.append(i_names)
-
-            # prepare constants
-            product = [*itertools.product(*ol_names)]
-            if track_changes:
-                print(f"Constants in current layer: {product}")
-
-            # crate transitions graph from product and names of states in
-            # current layer
+        transitions_graphs = {}
+        for layer_name, edges in transitions.items():
             graph = nx.DiGraph()
-            for p in product:
-                transitions = [
-                    tuple(sorted((*a, b)))
-                    for a, b in [*itertools.product([p], cl_names)]
-                ]
-                for edge in itertools.permutations(transitions, 2):
-                    if track_changes:
-                        print(edge)
-                    graph.add_edge(*edge, weight=background_weight)
+            graph.add_edges_from(edges, weight=background_weight)
             transitions_graphs.update({layer_name: graph})
 
         # save created graphs as attribute of the object
         self.graph = transitions_graphs
         self.background_weight = background_weight
+        self._derived = _DerivedData(edge_tuples=transitions)
+        self._build_transition_index()
+
+    def _build_transition_index(self) -> None:
+        """Index transitions with nonzero weight by the layer and the state."""
+        self._derived.transition_index = {}
+
+        # right after compilation all transitions have background weight, so
+        # there is nothing to index if it is zero
+        if self.background_weight == 0:
+            return
+
+        for layer, graph in self.graph.items():
+            for start, finish, weight in graph.edges(data="weight"):
+                self._index_transition(layer, (start, finish), weight)
+
+    def _index_transition(
+        self,
+        layer: str,
+        transition: tuple[tuple[str, ...], tuple[str, ...]],
+        weight: float,
+    ) -> None:
+        """Update entry of the transition in the index of possible ones."""
+        start, finish = transition
+        layer_tag = layer + "."
+        finish_state = next(
+            n[len(layer_tag) :] for n in finish if n.startswith(layer_tag)
+        )
+        reachable_states = self._derived.transition_index.setdefault(
+            (layer, start), {}
+        )
+        if weight > 0:
+            reachable_states[finish_state] = weight
+        else:
+            reachable_states.pop(finish_state, None)
 
     def set_transition_canonical(
         self, layer: str, transition: nx.graph.EdgeView, weight: float
@@ -267,7 +341,10 @@ class CompartmentalGraph:
         :param weight: in range (number [0, 1]) of activation
         """
         assert 1 >= weight >= 0, "Weight value should be in [0, 1] range"
-        self.graph[layer].edges[transition]["weight"] = weight
+        start, finish = transition
+        self.graph[layer].adj[start][finish]["weight"] = weight
+        self._index_transition(layer, transition, weight)
+        self._derived.transition_tensors.pop(layer, None)
 
     def set_transition_fast(
         self,
@@ -289,21 +366,45 @@ class CompartmentalGraph:
         """
         # check data validate
         assert 1 >= weight >= 0, "Weight value should be in [0, 1] range"
-        layer_name = initial_layer_attribute.split(".")[0]
-        assert (
-            layer_name == final_layer_attribute.split(".")[0]
-        ), "Layers must have one name!"
-
-        # make transitions
-        initial_state = tuple(
-            sorted([initial_layer_attribute, *constraint_attributes])
+        layer_name, _, initial_state = initial_layer_attribute.partition(".")
+        final_layer_name, _, final_state = final_layer_attribute.partition(".")
+        assert layer_name == final_layer_name, "Layers must have one name!"
+
+        # make transition
+        self.set_transitions_fast_bulk(
+            layer_name,
+            constraint_attributes,
+            [(initial_state, final_state, weight)],
         )
-        final_state = tuple(
-            sorted([final_layer_attribute, *constraint_attributes])
-        )
-        self.graph[layer_name].edges[(initial_state, final_state)][
-            "weight"
-        ] = weight
+
+    def set_transitions_fast_bulk(
+        self,
+        layer_name: str,
+        constraint_attributes: tuple[str, ...],
+        transitions: Iterable[tuple[str, str, float]],
+    ) -> None:
+        """
+        Set weights of many transitions in a layer that share constraints.
+
+        :param layer_name: name of the layer in the model
+        :param constraint_attributes: other attributes available in the
+            propagation model, e.g. ('2.B', '3.A')
+        :param transitions: triples of initial state name, final state name
+            (both without the layer prefix, e.g. 'A') and weight (in range
+            [0, 1]) of activation
+        """
+        constraints = sorted(constraint_attributes)
+
+        def to_state(layer_state: str) -> tuple[str, ...]:
+            state = constraints.copy()
+            bisect.insort(state, f"{layer_name}.{layer_state}")
+            return tuple(state)
+
+        for initial_state, final_state, weight in transitions:
+            transition = (to_state(initial_state), to_state(final_state))
+            self.set_transition_canonical(
+                layer_name, transition, weight  # type: ignore
+            )
 
     def set_transitions_in_random_edges(
         self, weights: list[list[float]]
@@ -322,19 +423,18 @@ class CompartmentalGraph:
         )
 
         # main loop
-        for (name, graph), weight in zip(self.graph.items(), weights):
-
-            edges_list = []
-            for wght in weight:
+        for name, weight in zip(self.graph, weights):
 
-                # select random edge and check if it has not been selected
-                # previously
-                edge = choice([*graph.edges()])
-                while edge in edges_list:
-                    edge = choice([*graph.edges()])
-                edges_list.append(edge)
+            # select distinct random edges without repetitions
+            edges = self._derived.edge_tuples[name]
+            assert len(weight) <= len(edges), (
+                f"Too many weights given for layer {name} - there are only "
+                f"{len(edges)} transitions!"
+            )
+            picked_edges = sample(edges, len(weight))
 
-                # assign weight to picked edge
+            # assign weights to picked edges
+            for edge, wght in zip(picked_edges, weight):
                 self.set_transition_canonical(name, edge, wght)  # type: ignore
 
     def get_possible_transitions(
@@ -357,16 +457,162 @@ class CompartmentalGraph:
             self.__dict__["graph"] is not None
         ), "Failed to process. Compile model first!"
 
-        # initialise empty container for possible transitions
-        reachable_states = {}
-
-        # read possible states from model
-        for neighbour in self.graph[layer].neighbors(state):
-            if self.graph[layer].edges[(state, neighbour)]["weight"] > 0:
-                # parse general state to keep only state name in given layer
-                for n in neighbour:
-                    if layer in n:
-                        reachable_states[n.split(".")[1]] = self.graph[
-                            layer
-                        ].edges[(state, neighbour)]["weight"]
-        return reachable_states
+        assert (
+            state in self.graph[layer]
+        ), f"State {state} does not exist in layer {layer}!"
+
+        return dict(self._derived.transition_index.get((layer, state), {}))
+
+    def get_possible_transitions_actor(
+        self, actor: MLNetworkActor, layer: str
+    ) -> dict[str, float]:
+        """
+        Return possible transitions of given actor in given layer of model.
+
+        Actor's states are converted to the form accepted by the model in the
+        same way as in `MLNetworkActor.states_as_compartmental_graph`, hence
+        actors absent in some processes fail the lookup. Converted states are
+        cached, since actors share them frequently, and interned, so that
+        lookups in the transition index compare them by identity.
+
+        :param actor: actor to get possible transitions for
+        :param layer: name of the layer of propagation model from which
+            possible transitions are being returned
+        :return: dict with possible transitions in shape of:
+                 {possible different state in given layer: weight}
+        """
+        actor_states = tuple(actor.states.items())
+        state = self._derived.actor_states.get(actor_states)
+        if state is None:
+            state = tuple(
+                sorted(
+                    sys.intern(f"{l_name}.{l_state}")
+                    for l_name, l_state in actor_states
+                )
+            )
+            self._derived.actor_states[actor_states] = state
+        return self.get_possible_transitions(state, layer)
+
+    def _get_transition_tensor(self, layer: str) -> np.ndarray:
+        """
+        Get dense tensor with weights of transitions in given layer.
+
+        The tensor is indexed by positions of states in all processes (in
+        order of `get_compartments`) followed by a position of a target state
+        in given layer. It is built lazily and cached until weights change.
+        """
+        if layer not in self._derived.transition_tensors:
+            comps = self.get_compartments()
+            l_states = {state: idx for idx, state in enumerate(comps[layer])}
+            cardinalities = [len(states) for states in comps.values()]
+            tensor = np.zeros((*cardinalities, len(l_states)))
+            for idx in np.ndindex(*cardinalities):
+                state = tuple(
+                    sorted(f"{p}.{comps[p][i]}" for p, i in zip(comps, idx))
+                )
+                reachable_states = self.get_possible_transitions(state, layer)
+                for new_state, weight in reachable_states.items():
+                    tensor[(*idx, l_states[new_state])] = weight
+            self._derived.transition_tensors[layer] = tensor
+        return self._derived.transition_tensors[layer]
+
+    def get_possible_transitions_fast(
+        self, state: tuple[int, ...], layer: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return possible transitions from state given as positions of states.
+
+        :param state: positions of states in each of processes (in order of
+            `get_compartments`), e.g. (0, 2, 1)
+        :param layer: name of the layer of propagation model from which
+            possible transitions are being returned
+        :return: positions of reachable states in given layer and weights of
+            transitions to them as contiguous arrays
+        """
+        weights = self._get_transition_tensor(layer)[state]
+        reachable_states = np.flatnonzero(weights)
+        return reachable_states, weights[reachable_states]
+
+    def get_possible_transitions_actors(
+        self, actors_states: np.ndarray, layer: str
+    ) -> np.ndarray:
+        """
+        Return weights of transitions for many actors at once.
+
+        :param actors_states: an integer array of shape (N, L) with states of
+            N actors in L processes; columns follow order of processes in
+            `get_compartments` and values are positions of actors' states in
+            each of processes
+        :param layer: name of the layer of propagation model from which
+            possible transitions are being returned
+        :return: an array of shape (N, S) with weights of transitions of each
+            actor to each of S states of given layer, where impossible
+            transitions are weighted by 0
+        """
+        tensor = self._get_transition_tensor(layer)
+        return tensor[tuple(np.asarray(actors_states).T)]
+
+
+def _create_transitions(
+    compartments: tuple[tuple[str, tuple[str, ...]], ...],
+    track_changes: bool = False,
+) -> tuple[
+    tuple[str, tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]], ...
+]:
+    """
+    Create all possible transitions for each process of compartmental graph.
+
+    :param compartments: names of processes and their states
+    :param track_changes: a flag to track progress of transitions creation
+    :return: a tuple of pairs of process names and transitions (i.e. pairs of
+        global states) of the process; it is immutable so that it can be
+        safely shared between compiled models
+    """
+    # prepare names of states in each layer once for all layers
+    layers_names = {
+        layer_name: [sys.intern(f"{layer_name}.{v}") for v in layer_type]
+        for layer_name, layer_type in compartments
+    }
+
+    # create transitions for each layer
+    transitions = []
+    for layer_name, cl_names in layers_names.items():
+        if track_changes:
+            print(layer_name)
+            print(f"Variables in current layer: {cl_names}")
+
+        # prepare names in other layers which are constant to current layer
+        ol_names = [
+            names for name, names in layers_names.items() if name != layer_name
+        ]
+
+        # prepare constants, materialise them only to print progress
+        product: Iterable[tuple[str, ...]] = itertools.product(*ol_names)
+        if track_changes:
+            product = [*product]
+            print(f"Constants in current layer: {product}")
+
+        # crate transitions from product and names of states in current layer
+        edges = []
+        for p in product:
+            constants = sorted(p)
+            states = []
+            for cl_name in cl_names:
+                state = constants.copy()
+                bisect.insort(state, cl_name)
+                states.append(tuple(state))
+            for edge in itertools.permutations(states, 2):
+                if track_changes:
+                    print(edge)
+                edges.append(edge)
+        transitions.append((layer_name, tuple(edges)))
+
+    return tuple(transitions)
+
+
+# transitions are cached only for small models, since each cached set is kept
+# alive for the whole process
+_CACHED_TRANSITIONS_LIMIT = 10_000
+_create_transitions_cached = functools.lru_cache(maxsize=4)(
+    _create_transitions
+)
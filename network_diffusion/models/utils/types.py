@@ -11,7 +11,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class NetworkUpdateBuffer:
     """Auxiliary class to keep info about nodes that needs to be updated."""
 
@@ -121,10 +121,15 @@ class Simulator:
             self._verify_network(self._network, n_epochs)
 
         # main simulation loop
-        p_bar = tqdm(range(n_epochs), "experiment", leave=False, colour="blue")
+        p_bar = tqdm(
+            range(n_epochs),
+            "Processing epochs",
+            leave=False,
+            colour="blue",
+            mininterval=0.5,
+        )
         old_states = initial_states
         for epoch in p_bar:
-            p_bar.set_description_str(f"Processing epoch {epoch}")
 
             # obtain structure of the network in current and next epoch
             curr_snap = snap_iterator(epoch)
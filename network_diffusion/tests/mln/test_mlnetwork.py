@@ -6,6 +6,7 @@ import networkx as nx
 
 from network_diffusion import utils
 from network_diffusion.mln import MLNetworkActor, MultilayerNetwork
+from network_diffusion.mln.mlnetwork import _average_clustering
 
 
 def copy_helper(original_network, copied_network):
@@ -182,6 +183,31 @@ class TestMultilayerNetwork(unittest.TestCase):
             "business": {"Ridolfi", "Albizzi", "Acciaiuoli", "Strozzi"},
         }
 
+    def test__average_clustering(self):
+        """Check if clustering is computed the same way as in networkx."""
+        hub = nx.star_graph(2000)
+        hub.add_edges_from([(1, 2), (3, 4), (4, 5), (5, 3)])
+        graphs = [
+            nx.les_miserables_graph(),
+            nx.Graph([(1, 1), (1, 2), (2, 3), (3, 1), (3, 4)]),
+            nx.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4)]),
+            hub,
+            *self.florentine.layers.values(),
+        ]
+        for graph in graphs:
+            self.assertAlmostEqual(
+                _average_clustering(graph), nx.average_clustering(graph)
+            )
+
+    def test___str__hub_layer(self):
+        """Check if a layer with a hub is described with its clustering."""
+        net = MultilayerNetwork(
+            {"star": nx.star_graph(2000), "tri": nx.complete_graph(3)}
+        )
+        description = str(net)
+        self.assertIn("clustering coefficient - 0.0\n", description)
+        self.assertIn("clustering coefficient - 1.0\n", description)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -15,29 +15,49 @@ EXPECTED_SPREADING_OUTCOME = [
         "vacc": (("UV", 69), ("V", 8)),
     },
     {
-        "ill": (("S", 18), ("I", 56), ("R", 3)),
-        "aware": (("UA", 34), ("A", 43)),
+        "ill": (("S", 16), ("I", 58), ("R", 3)),
+        "aware": (("UA", 35), ("A", 42)),
         "vacc": (("UV", 69), ("V", 8)),
     },
     {
-        "ill": (("I", 53), ("R", 18), ("S", 6)),
-        "aware": (("UA", 24), ("A", 53)),
-        "vacc": (("UV", 68), ("V", 9)),
+        "ill": (("I", 68), ("R", 3), ("S", 6)),
+        "aware": (("UA", 23), ("A", 54)),
+        "vacc": (("UV", 69), ("V", 8)),
+    },
+    {
+        "ill": (("I", 45), ("R", 27), ("S", 5)),
+        "aware": (("UA", 19), ("A", 58)),
+        "vacc": (("UV", 69), ("V", 8)),
     },
     {
-        "ill": (("I", 27), ("R", 44), ("S", 6)),
-        "aware": (("UA", 17), ("A", 60)),
-        "vacc": (("UV", 66), ("V", 11)),
+        "ill": (("I", 26), ("R", 47), ("S", 4)),
+        "aware": (("UA", 15), ("A", 62)),
+        "vacc": (("UV", 69), ("V", 8)),
     },
     {
-        "ill": (("I", 18), ("R", 53), ("S", 6)),
+        "ill": (("I", 20), ("R", 53), ("S", 4)),
         "aware": (("UA", 13), ("A", 64)),
-        "vacc": (("UV", 66), ("V", 11)),
+        "vacc": (("UV", 69), ("V", 8)),
     },
     {
-        "ill": (("I", 18), ("R", 53), ("S", 6)),
+        "ill": (("I", 13), ("R", 60), ("S", 4)),
         "aware": (("UA", 13), ("A", 64)),
-        "vacc": (("UV", 66), ("V", 11)),
+        "vacc": (("UV", 69), ("V", 8)),
+    },
+    {
+        "ill": (("I", 10), ("R", 63), ("S", 4)),
+        "aware": (("UA", 13), ("A", 64)),
+        "vacc": (("UV", 69), ("V", 8)),
+    },
+    {
+        "ill": (("I", 9), ("R", 64), ("S", 4)),
+        "aware": (("UA", 13), ("A", 64)),
+        "vacc": (("UV", 69), ("V", 8)),
+    },
+    {
+        "ill": (("I", 9), ("R", 64), ("S", 4)),
+        "aware": (("UA", 13), ("A", 64)),
+        "vacc": (("UV", 69), ("V", 8)),
     },
 ]
 
@@ -167,3 +187,18 @@ class TestDSAAModel(unittest.TestCase):
             f"Wrong course of the spreading process, expected "
             f"{EXPECTED_SPREADING_OUTCOME} found {logs.get_aggragated_logs()}",
         )
+
+    def test_agent_evaluation_step_missing_layer(self):
+        """Check if evaluating an actor absent in some layers fails."""
+        net = MultilayerNetwork(
+            {
+                "ill": nx.path_graph(2),
+                "aware": nx.path_graph(2),
+                "vacc": nx.path_graph(1),
+            }
+        )
+        nx.set_node_attributes(net.layers["ill"], "S", "status")
+        nx.set_node_attributes(net.layers["aware"], "UA", "status")
+        nx.set_node_attributes(net.layers["vacc"], "UV", "status")
+        with self.assertRaises(AssertionError):
+            self.model.agent_evaluation_step(1, "ill", net)
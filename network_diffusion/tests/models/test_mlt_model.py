@@ -1,5 +1,8 @@
 import unittest
 
+import networkx as nx
+
+from network_diffusion.mln import MultilayerNetwork
 from network_diffusion.mln.functions import get_toy_network_piotr
 from network_diffusion.models import MLTModel
 from network_diffusion.seeding.mocking_selector import MockingActorSelector
@@ -119,3 +122,20 @@ class TestMLTModel(unittest.TestCase):
                     f"{exp_result} found {logs._global_stats} "
                     f"params: ({protocol}, {mi_value})",
                 )
+
+    def test_agent_evaluation_step_isolated_actor(self):
+        """Check if an isolated actor remains in its state."""
+        mltm = MLTModel(
+            protocol="OR",
+            seed_selector=self.seed_selector,
+            seeding_budget=self.budget,
+            mi_value=0.5,
+        )
+        layer = nx.Graph()
+        layer.add_node(0)
+        net = MultilayerNetwork({"l1": layer})
+        net.layers["l1"].nodes[0]["status"] = mltm.INACTIVE_STATE
+        self.assertEqual(
+            mltm.agent_evaluation_step(net.get_actor(0), "l1", net),
+            mltm.INACTIVE_STATE,
+        )
@@ -1,8 +1,14 @@
 import unittest
 
 import networkx as nx
+import numpy as np
 
-from network_diffusion.models.utils.compartmental import CompartmentalGraph
+from network_diffusion.mln.actor import MLNetworkActor
+from network_diffusion.models.utils.compartmental import (
+    CompartmentalGraph,
+    _create_transitions_cached,
+    _DerivedData,
+)
 from network_diffusion.utils import BOLD_UNDERLINE, THIN_UNDERLINE
 
 
@@ -30,6 +36,7 @@ class TestCompartmentalGraph(unittest.TestCase):
                 "graph": {},
                 "background_weight": float("inf"),
                 "_seeding_budget": {},
+                "_derived": _DerivedData(),
                 "1": ["A", "B", "C"],
             },
             "add func seems to have no effect",
@@ -68,6 +75,20 @@ class TestCompartmentalGraph(unittest.TestCase):
             "Incorrect hyperparameters of CompartmentalGraph!",
         )
 
+    def test_get_compartments_cache(self):
+        """Check if cached compartments are refreshed after adding process."""
+        model = CompartmentalGraph()
+        model.add("1", ["A", "B"])
+        self.assertEqual(model.get_compartments(), {"1": ["A", "B"]})
+        model.get_compartments().pop("1")
+        self.assertEqual(model.get_compartments(), {"1": ["A", "B"]})
+        model.add("2", ["C", "D"])
+        self.assertEqual(
+            model.get_compartments(),
+            {"1": ["A", "B"], "2": ["C", "D"]},
+            "Cached compartments have not been invalidated after add!",
+        )
+
     def test_compile(self):
         """Check if compilation runs correctly."""
         model = CompartmentalGraph()
@@ -124,6 +145,37 @@ class TestCompartmentalGraph(unittest.TestCase):
             f"Graph in layer 2 should be like {exp_graph_phenomena_2}",
         )
 
+    def test_compile_reused_transitions(self):
+        """Check if models compiled from the same compartments are separate."""
+        model_1 = get_compiled_model()
+        model_2 = get_compiled_model()
+        model_1.set_transition_fast("1.C", "1.A", ("2.B", "3.A"), 0.1791)
+        weight = model_2.graph["1"][("1.C", "2.B", "3.A")][
+            ("1.A", "2.B", "3.A")
+        ]
+        self.assertEqual(weight["weight"], 0.005)
+        model_1.compile(background_weight=0.1)
+        weight = model_1.graph["1"][("1.C", "2.B", "3.A")][
+            ("1.A", "2.B", "3.A")
+        ]
+        self.assertEqual(weight["weight"], 0.1)
+        self.assertIsNot(
+            model_1._derived.edge_tuples, model_2._derived.edge_tuples
+        )
+        model_1._derived.edge_tuples.clear()
+        self.assertEqual(len(model_2._derived.edge_tuples), 3)
+
+    def test_compile_cached_transitions_limit(self):
+        """Check if transitions of large models are not cached."""
+        _create_transitions_cached.cache_clear()
+        model = CompartmentalGraph()
+        for proc in ("1", "2", "3"):
+            model.add(proc, [str(state) for state in range(8)])
+        model.compile()
+        self.assertEqual(_create_transitions_cached.cache_info().currsize, 0)
+        get_compiled_model()
+        self.assertEqual(_create_transitions_cached.cache_info().currsize, 1)
+
     def test_set_transition_canonical(self):
         """Checks if setting transitions in canonical way is possible."""
         model = get_compiled_model()
@@ -178,6 +230,21 @@ class TestCompartmentalGraph(unittest.TestCase):
             f"{weight['weight']}",
         )
 
+    def test_set_transitions_fast_bulk(self):
+        """Checks if setting many transitions at once is possible."""
+        model = get_compiled_model()
+        model.set_transitions_fast_bulk(
+            "1", ("3.A", "2.B"), [("C", "A", 0.1791), ("A", "B", 0.2137)]
+        )
+        weight_1 = model.graph["1"][("1.C", "2.B", "3.A")][
+            ("1.A", "2.B", "3.A")
+        ]
+        weight_2 = model.graph["1"][("1.A", "2.B", "3.A")][
+            ("1.B", "2.B", "3.A")
+        ]
+        self.assertEqual(weight_1["weight"], 0.1791)
+        self.assertEqual(weight_2["weight"], 0.2137)
+
     def test_set_transitions_in_random_edges(self):
         """Check if setting transitions in random way is possible."""
         model = get_compiled_model()
@@ -246,6 +313,82 @@ class TestCompartmentalGraph(unittest.TestCase):
             f"be {exp_res_3}, was {case_3}",
         )
 
+    def test_get_possible_transitions_after_update(self):
+        """Check if possible transitions follow changes of weights."""
+        model = get_compiled_model()
+        state = ("1.C", "2.B", "3.A")
+        model.set_transition_fast("1.C", "1.A", ("2.B", "3.A"), 0.1791)
+        self.assertEqual(
+            model.get_possible_transitions(state=state, layer="1"),
+            {"A": 0.1791, "B": 0.005},
+        )
+        model.set_transition_fast("1.C", "1.B", ("2.B", "3.A"), 0.0)
+        self.assertEqual(
+            model.get_possible_transitions(state=state, layer="1"),
+            {"A": 0.1791},
+        )
+
+    def test_get_possible_transitions_copy(self):
+        """Check if modifying returned transitions doesn't change model."""
+        model = get_compiled_model()
+        state = ("1.C", "2.B", "3.A")
+        model.get_possible_transitions(state=state, layer="1").pop("A")
+        self.assertEqual(
+            model.get_possible_transitions(state=state, layer="1"),
+            {"A": 0.005, "B": 0.005},
+        )
+
+    def test_get_possible_transitions_unknown_state(self):
+        """Check if asking for transitions of unknown state fails."""
+        model = get_compiled_model()
+        with self.assertRaises(AssertionError):
+            model.get_possible_transitions(state=("1.C", "2.B"), layer="1")
+
+    def test_get_possible_transitions_actor(self):
+        """Check if possible transitions are returned for the actor."""
+        model = get_compiled_model()
+        actor = MLNetworkActor("a", {"2": "B", "1": "C", "3": "A"})
+        self.assertEqual(
+            model.get_possible_transitions_actor(actor, "1"),
+            {"A": 0.005, "B": 0.005},
+        )
+        self.assertEqual(
+            model.get_possible_transitions_actor(actor, "1"),
+            model.get_possible_transitions(
+                actor.states_as_compartmental_graph(), "1"
+            ),
+        )
+        partial_actor = MLNetworkActor("b", {"1": "C", "2": "B"})
+        with self.assertRaises(AssertionError):
+            model.get_possible_transitions_actor(partial_actor, "3")
+
+    def test_get_possible_transitions_fast(self):
+        """Check if possible transitions are returned as arrays."""
+        model = get_compiled_model()
+        model.set_transition_fast("1.C", "1.A", ("2.B", "3.A"), 0.0)
+        states, weights = model.get_possible_transitions_fast((2, 1, 0), "1")
+        self.assertEqual(states.tolist(), [1])
+        self.assertEqual(weights.tolist(), [0.005])
+
+    def test_get_possible_transitions_actors(self):
+        """Check if possible transitions are returned for many actors."""
+        model = get_compiled_model()
+        model.set_transition_fast("1.C", "1.A", ("2.B", "3.A"), 0.1791)
+        actors_states = np.array([[2, 1, 0], [0, 0, 0]])
+        self.assertTrue(
+            np.array_equal(
+                model.get_possible_transitions_actors(actors_states, "1"),
+                np.array([[0.1791, 0.005, 0.0], [0.0, 0.005, 0.005]]),
+            )
+        )
+        model.set_transition_fast("1.A", "1.B", ("2.A", "3.A"), 0.0)
+        self.assertTrue(
+            np.array_equal(
+                model.get_possible_transitions_actors(actors_states, "1"),
+                np.array([[0.1791, 0.005, 0.0], [0.0, 0.0, 0.005]]),
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)